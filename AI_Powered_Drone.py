@@ -1,18 +1,46 @@
 import numpy as np
-import cv2
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
-import pandas as pd
 import json
+import math
 import time
-import random
 from datetime import datetime
 from dataclasses import dataclass
 from typing import List, Tuple, Dict, Optional
 import threading
 import queue
 
+try:
+    import numba as nb
+except ImportError:  # numba is optional; fall back to plain NumPy
+    nb = None
+
+if nb is not None:
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def _add_noise_clip(base, out):
+        """Add uniform [-30, 30) noise to base and clamp to uint8 in a single pass"""
+        # Noise is drawn in-kernel (per-thread RNG state), so no noise buffer is needed
+        for i in nb.prange(base.size):
+            v = np.int16(base[i]) + np.random.randint(-30, 30)
+            out[i] = 0 if v < 0 else (255 if v > 255 else v)
+else:
+    _add_noise_clip = None
+
+# Overlay colors per severity, as RGBA so matplotlib skips color-string parsing
+SEVERITY_RGBA = {
+    'low': (1.0, 1.0, 0.0, 0.8),        # yellow
+    'medium': (1.0, 0.65, 0.0, 0.8),    # orange
+    'high': (1.0, 0.0, 0.0, 0.8),       # red
+    'critical': (0.55, 0.0, 0.0, 0.8),  # darkred
+}
+
+# Integer codes used by the column-oriented anomaly log
+ANOMALY_TYPES = ('crack', 'rust', 'loose_bolt', 'corrosion')
+SEVERITY_LEVELS = ('low', 'medium', 'high', 'critical')
+TYPE_CODES = {t: i for i, t in enumerate(ANOMALY_TYPES)}
+SEVERITY_CODES = {s: i for i, s in enumerate(SEVERITY_LEVELS)}
+_SEVERITY_RGBA_TABLE = np.array([SEVERITY_RGBA[s] for s in SEVERITY_LEVELS])
+
 @dataclass
 class Waypoint:
     """Represents a waypoint in the drone's flight path"""
@@ -24,14 +52,82 @@ class Waypoint:
 @dataclass
 class Anomaly:
     """Represents a detected anomaly"""
+    # Slots avoid a per-instance __dict__ (spelled out since slots=True needs Python 3.10)
+    __slots__ = ('id', 'type', 'confidence', 'position', 'timestamp', 'bbox', 'severity')
+    
     id: str
     type: str  # 'crack', 'rust', 'loose_bolt', 'corrosion'
     confidence: float
     position: Tuple[float, float, float]
-    timestamp: datetime
+    timestamp: float  # seconds since the epoch, as returned by time.time()
     bbox: Tuple[int, int, int, int]  # x, y, width, height
     severity: str  # 'low', 'medium', 'high', 'critical'
 
+class AnomalyLog:
+    """Column-oriented (SoA) store of detected anomalies"""
+    
+    def __init__(self, capacity: int = 1024):
+        self.count = 0
+        self.position = np.empty((capacity, 3), dtype=np.float64)
+        self.type = np.empty(capacity, dtype=np.int8)
+        self.severity = np.empty(capacity, dtype=np.int8)
+        self.confidence = np.empty(capacity, dtype=np.float64)
+        self.timestamp = np.empty(capacity, dtype=np.float64)
+        self.bbox = np.empty((capacity, 4), dtype=np.int16)
+        self.ids: List[str] = []
+        
+    def clear(self):
+        """Forget all logged anomalies (capacity is kept)"""
+        self.count = 0
+        self.ids = []
+        
+    def extend(self, anomalies: List[Anomaly]):
+        """Append anomalies, doubling the columns when they fill up"""
+        n = self.count
+        while n + len(anomalies) > len(self.type):
+            for name in ('position', 'type', 'severity', 'confidence', 'timestamp', 'bbox'):
+                column = getattr(self, name)
+                setattr(self, name, np.concatenate((column, np.empty_like(column))))
+                
+        for i, anomaly in enumerate(anomalies):
+            self.position[n + i] = anomaly.position
+            self.type[n + i] = TYPE_CODES[anomaly.type]
+            self.severity[n + i] = SEVERITY_CODES[anomaly.severity]
+            self.confidence[n + i] = anomaly.confidence
+            self.timestamp[n + i] = anomaly.timestamp
+            self.bbox[n + i] = anomaly.bbox
+            self.ids.append(anomaly.id)
+            
+        # Bump the count last so a concurrent reader only sees complete rows
+        self.count = n + len(anomalies)
+        
+    def count_by_type(self) -> Dict[str, int]:
+        """Number of anomalies per type"""
+        n = self.count  # read before the column, which extend() may swap when growing
+        counts = np.bincount(self.type[:n], minlength=len(ANOMALY_TYPES))
+        return dict(zip(ANOMALY_TYPES, counts.tolist()))
+    
+    def count_by_severity(self) -> Dict[str, int]:
+        """Number of anomalies per severity level"""
+        n = self.count  # read before the column, which extend() may swap when growing
+        counts = np.bincount(self.severity[:n], minlength=len(SEVERITY_LEVELS))
+        return dict(zip(SEVERITY_LEVELS, counts.tolist()))
+    
+    def to_anomalies(self) -> List[Anomaly]:
+        """Materialize the log as Anomaly objects (used for reporting)"""
+        anomalies = []
+        for i in range(self.count):
+            anomalies.append(Anomaly(
+                id=self.ids[i],
+                type=ANOMALY_TYPES[self.type[i]],
+                confidence=float(self.confidence[i]),
+                position=tuple(self.position[i].tolist()),
+                timestamp=float(self.timestamp[i]),
+                bbox=tuple(self.bbox[i].tolist()),
+                severity=SEVERITY_LEVELS[self.severity[i]]
+            ))
+        return anomalies
+
 class DroneSimulator:
     """Simulates drone movement and sensor data"""
     
@@ -43,13 +139,26 @@ class DroneSimulator:
         self.waypoints = []
         self.is_flying = False
         self.battery_level = 100.0
-        self.flight_path = []
+        
+        # Flight path is logged into a preallocated (N, 3) buffer with a write cursor
+        self._flight_path_buf = np.empty((10000, 3), dtype=np.float32)
+        self._fp_len = 0
+        
+        # Static scene is rendered once; only sensor noise changes per frame
+        self._base_frame = self._build_base_frame()
+        self._scratch = np.empty(self._base_frame.shape, dtype=np.int16)
+        self._rng = np.random.default_rng()
         
     def set_flight_path(self, waypoints: List[Waypoint]):
         """Set the inspection flight path"""
         self.waypoints = waypoints
         self.current_waypoint_idx = 0
-        self.flight_path = []
+        self._fp_len = 0
+        
+    @property
+    def flight_path(self) -> np.ndarray:
+        """Logged flight path positions as an (N, 3) view into the buffer"""
+        return self._flight_path_buf[:self._fp_len]
         
     def update_position(self, dt: float = 0.1):
         """Update drone position based on current waypoint"""
@@ -58,11 +167,11 @@ class DroneSimulator:
             return
             
         target = self.waypoints[self.current_waypoint_idx]
-        target_pos = np.array([target.x, target.y, target.z])
         
-        # Calculate direction to target
-        direction = target_pos - self.position
-        distance = np.linalg.norm(direction)
+        # Calculate direction to target (scalar math; cheaper than ndarray ops on a 3-vector)
+        px, py, pz = self.position.tolist()
+        dx, dy, dz = target.x - px, target.y - py, target.z - pz
+        distance = math.sqrt(dx*dx + dy*dy + dz*dz)
         
         if distance < 1.0:  # Reached waypoint
             self.current_waypoint_idx += 1
@@ -72,60 +181,74 @@ class DroneSimulator:
         
         # Move towards target
         if distance > 0:
-            direction_normalized = direction / distance
-            self.velocity = direction_normalized * min(self.max_speed, distance * 2)
-            self.position += self.velocity * dt
+            scale = min(self.max_speed, distance * 2) / distance
+            vx, vy, vz = dx * scale, dy * scale, dz * scale
+            self.velocity[:] = (vx, vy, vz)
+            self.position[:] = (px + vx * dt, py + vy * dt, pz + vz * dt)
             
         # Update battery (simplified)
         self.battery_level -= 0.1 * dt
         
-        # Log flight path
-        self.flight_path.append(self.position.copy())
+        # Log flight path, doubling the buffer when it fills up
+        if self._fp_len == len(self._flight_path_buf):
+            self._flight_path_buf = np.concatenate(
+                (self._flight_path_buf, np.empty_like(self._flight_path_buf))
+            )
+        self._flight_path_buf[self._fp_len] = self.position
+        self._fp_len += 1
         
-    def get_camera_view(self) -> np.ndarray:
-        """Generate simulated camera view - FIXED VERSION"""
+    def _build_base_frame(self) -> np.ndarray:
+        """Render the static infrastructure scene used as the camera template"""
         # Create a synthetic image representing infrastructure view in RGB format
-        img = np.ones((480, 640, 3), dtype=np.uint8) * 120  # Light gray background
+        img = np.full((480, 640, 3), 120, dtype=np.uint8)  # Light gray background
         
         # Add concrete texture
-        img[50:430, 50:590] = [140, 140, 140]  # Using numpy indexing instead of cv2.rectangle
-        
-        # Add realistic texture with noise
-        noise = np.random.randint(-30, 30, (480, 640, 3), dtype=np.int16)
-        img = np.clip(img.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+        img[50:430, 50:590] = 140  # Scalar fill; R=G=B for all scene elements
         
         # Add infrastructure elements
         # Main beam (darker) - using numpy indexing for RGB
-        img[190:210, 80:560] = [80, 80, 80]
+        img[190:210, 80:560] = 80
         
-        # Add bolts manually
+        # Add bolts using vectorized circular masks
         for center_x, center_y in [(150, 200), (320, 200), (490, 200)]:
             y_min, y_max = max(0, center_y - 15), min(480, center_y + 15)
             x_min, x_max = max(0, center_x - 15), min(640, center_x + 15)
             
             # Create circular mask for bolts
-            for y in range(y_min, y_max):
-                for x in range(x_min, x_max):
-                    if (x - center_x)**2 + (y - center_y)**2 <= 15**2:
-                        img[y, x] = [50, 50, 50]
+            yy, xx = np.ogrid[y_min:y_max, x_min:x_max]
+            mask = (xx - center_x)**2 + (yy - center_y)**2 <= 15**2
+            img[y_min:y_max, x_min:x_max][mask] = 50
         
         # Support structures
-        img[100:300, 200:220] = [90, 90, 90]
-        img[100:300, 420:440] = [90, 90, 90]
+        img[100:300, 200:220] = 90
+        img[100:300, 420:440] = 90
         
         # Add some wear patterns (elliptical areas)
         # Simple ellipse approximation
-        for y in range(130, 170):
-            for x in range(210, 290):
-                if ((x - 250)/40)**2 + ((y - 150)/20)**2 <= 1:
-                    img[y, x] = [110, 110, 110]
-                    
-        for y in range(220, 280):
-            for x in range(320, 440):
-                if ((x - 380)/60)**2 + ((y - 250)/30)**2 <= 1:
-                    img[y, x] = [100, 100, 100]
+        yy, xx = np.ogrid[130:170, 210:290]
+        mask = ((xx - 250)/40)**2 + ((yy - 150)/20)**2 <= 1
+        img[130:170, 210:290][mask] = 110
+        
+        yy, xx = np.ogrid[220:280, 320:440]
+        mask = ((xx - 380)/60)**2 + ((yy - 250)/30)**2 <= 1
+        img[220:280, 320:440][mask] = 100
         
         return img
+        
+    def get_camera_view(self) -> np.ndarray:
+        """Generate simulated camera view from the cached scene plus fresh noise"""
+        # Add realistic texture with noise. A fresh output array is returned
+        # because frames are handed over to the dashboard thread.
+        if _add_noise_clip is not None:
+            img = np.empty_like(self._base_frame)
+            _add_noise_clip(self._base_frame.ravel(), img.ravel())
+            return img
+        
+        noise = self._rng.integers(-30, 30, self._base_frame.shape, dtype=np.int16)
+        np.add(self._base_frame, noise, out=self._scratch)
+        np.clip(self._scratch, 0, 255, out=self._scratch)
+        
+        return self._scratch.astype(np.uint8)
 
 class AnomalyDetector:
     """AI-powered anomaly detection system"""
@@ -137,20 +260,25 @@ class AnomalyDetector:
             'loose_bolt': self._detect_loose_bolts,
             'corrosion': self._detect_corrosion
         }
+        self._rng = np.random.default_rng()
         
     def detect_anomalies(self, image: np.ndarray, position: Tuple[float, float, float]) -> List[Anomaly]:
         """Detect anomalies in the given image"""
         anomalies = []
         
+        # One clock read per frame; the index keeps IDs unique within the same ms
+        now = time.time()
+        ts_ms = int(now * 1000)
+        
         for anomaly_type, detector in self.detection_models.items():
             detected = detector(image)
             for detection in detected:
                 anomaly = Anomaly(
-                    id=f"{anomaly_type}_{int(time.time() * 1000)}",
+                    id=f"{anomaly_type}_{ts_ms}_{len(anomalies)}",
                     type=anomaly_type,
                     confidence=detection['confidence'],
                     position=position,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     bbox=detection['bbox'],
                     severity=detection['severity']
                 )
@@ -158,20 +286,26 @@ class AnomalyDetector:
                 
         return anomalies
     
+    @staticmethod
+    def _randint(u: float, low: int, high: int) -> int:
+        """Map a uniform draw in [0, 1) to an integer in [low, high]"""
+        return low + int(u * (high - low + 1))
+    
     def _detect_cracks(self, image: np.ndarray) -> List[Dict]:
         """Simulate crack detection"""
         detections = []
+        u = self._rng.random(7)
         
         # Simulate random crack detection
-        if random.random() < 0.3:  # 30% chance of detecting a crack
-            x = random.randint(50, 550)
-            y = random.randint(50, 400)
-            w, h = random.randint(80, 150), random.randint(10, 30)
+        if u[0] < 0.3:  # 30% chance of detecting a crack
+            x = self._randint(u[1], 50, 550)
+            y = self._randint(u[2], 50, 400)
+            w, h = self._randint(u[3], 80, 150), self._randint(u[4], 10, 30)
             
             detections.append({
                 'bbox': (x, y, w, h),
-                'confidence': random.uniform(0.7, 0.95),
-                'severity': random.choice(['low', 'medium', 'high'])
+                'confidence': 0.7 + u[5] * 0.25,
+                'severity': ('low', 'medium', 'high')[int(u[6] * 3)]
             })
             
         return detections
@@ -179,16 +313,17 @@ class AnomalyDetector:
     def _detect_rust(self, image: np.ndarray) -> List[Dict]:
         """Simulate rust detection"""
         detections = []
+        u = self._rng.random(7)
         
-        if random.random() < 0.25:  # 25% chance
-            x = random.randint(50, 500)
-            y = random.randint(50, 350)
-            w, h = random.randint(40, 100), random.randint(40, 100)
+        if u[0] < 0.25:  # 25% chance
+            x = self._randint(u[1], 50, 500)
+            y = self._randint(u[2], 50, 350)
+            w, h = self._randint(u[3], 40, 100), self._randint(u[4], 40, 100)
             
             detections.append({
                 'bbox': (x, y, w, h),
-                'confidence': random.uniform(0.6, 0.9),
-                'severity': random.choice(['low', 'medium'])
+                'confidence': 0.6 + u[5] * 0.3,
+                'severity': ('low', 'medium')[int(u[6] * 2)]
             })
             
         return detections
@@ -196,16 +331,17 @@ class AnomalyDetector:
     def _detect_loose_bolts(self, image: np.ndarray) -> List[Dict]:
         """Simulate loose bolt detection"""
         detections = []
+        u = self._rng.random(5)
         
-        if random.random() < 0.15:  # 15% chance
-            x = random.randint(290, 350)
-            y = random.randint(210, 270)
+        if u[0] < 0.15:  # 15% chance
+            x = self._randint(u[1], 290, 350)
+            y = self._randint(u[2], 210, 270)
             w, h = 60, 60
             
             detections.append({
                 'bbox': (x, y, w, h),
-                'confidence': random.uniform(0.8, 0.95),
-                'severity': random.choice(['medium', 'high', 'critical'])
+                'confidence': 0.8 + u[3] * 0.15,
+                'severity': ('medium', 'high', 'critical')[int(u[4] * 3)]
             })
             
         return detections
@@ -213,16 +349,17 @@ class AnomalyDetector:
     def _detect_corrosion(self, image: np.ndarray) -> List[Dict]:
         """Simulate corrosion detection"""
         detections = []
+        u = self._rng.random(7)
         
-        if random.random() < 0.2:  # 20% chance
-            x = random.randint(100, 450)
-            y = random.randint(100, 300)
-            w, h = random.randint(60, 120), random.randint(60, 120)
+        if u[0] < 0.2:  # 20% chance
+            x = self._randint(u[1], 100, 450)
+            y = self._randint(u[2], 100, 300)
+            w, h = self._randint(u[3], 60, 120), self._randint(u[4], 60, 120)
             
             detections.append({
                 'bbox': (x, y, w, h),
-                'confidence': random.uniform(0.65, 0.85),
-                'severity': random.choice(['low', 'medium', 'high'])
+                'confidence': 0.65 + u[5] * 0.2,
+                'severity': ('low', 'medium', 'high')[int(u[6] * 3)]
             })
             
         return detections
@@ -233,9 +370,19 @@ class InspectionDashboard:
     def __init__(self):
         self.drone = DroneSimulator()
         self.detector = AnomalyDetector()
-        self.anomalies = []
+        self.anomaly_log = AnomalyLog()
         self.inspection_active = False
         
+        # Simulation + detection run on a worker thread; the GUI only reads
+        # the latest published snapshot (single producer, single consumer)
+        self.sim_interval = 0.1  # seconds of simulated time per worker tick
+        self._latest = None
+        self._sim_thread = None
+        
+        # Detailed anomalies are streamed to disk as NDJSON while the mission runs
+        self.anomaly_stream_path: Optional[str] = None
+        self._report_fp = None
+        
         # Set up the dashboard
         self.fig, self.axes = plt.subplots(2, 2, figsize=(15, 10))
         self.fig.suptitle('AI-Powered Drone Infrastructure Inspection', fontsize=16)
@@ -246,11 +393,30 @@ class InspectionDashboard:
         self.ax_flight.set_xlabel('X (meters)')
         self.ax_flight.set_ylabel('Y (meters)')
         self.ax_flight.grid(True)
+        self._path_line, = self.ax_flight.plot([], [], 'b-', alpha=0.6, label='Flight Path')
+        self._pos_pt, = self.ax_flight.plot([], [], 'ro', markersize=10, label='Current Position')
+        self._wp_line, = self.ax_flight.plot([], [], 'gs', markersize=8, label='Waypoints')
+        self.ax_flight.legend()
         
         # Camera feed
         self.ax_camera = self.axes[0, 1]
         self.ax_camera.set_title('Live Camera Feed')
         self.ax_camera.axis('off')
+        self._cam_img = self.ax_camera.imshow(np.zeros((480, 640, 3), dtype=np.uint8), aspect='auto')
+        
+        # Reusable overlay boxes and labels (each detector reports at most one hit per frame)
+        self._rect_pool = []
+        self._label_pool = []
+        for _ in range(8):
+            rect = patches.Rectangle((0, 0), 0, 0, linewidth=3, facecolor='none',
+                                     visible=False)
+            self.ax_camera.add_patch(rect)
+            self._rect_pool.append(rect)
+            
+            label = self.ax_camera.text(0, 0, '', color='white', fontsize=9, fontweight='bold',
+                                        bbox=dict(boxstyle="round,pad=0.3"),
+                                        visible=False)
+            self._label_pool.append(label)
         
         # Anomaly map
         self.ax_anomalies = self.axes[1, 0]
@@ -259,156 +425,206 @@ class InspectionDashboard:
         self.ax_anomalies.set_ylabel('Y (meters)')
         self.ax_anomalies.grid(True)
         
+        # Single scatter fed straight from the anomaly log columns
+        self._anom_plotted = 0
+        self._anom_scatter = self.ax_anomalies.scatter([], [], s=64)
+        
         # Status panel
         self.ax_status = self.axes[1, 1]
         self.ax_status.set_title('System Status')
         self.ax_status.axis('off')
+        self._status_text = self.ax_status.text(0.1, 0.9, '', transform=self.ax_status.transAxes,
+                                                fontsize=10, verticalalignment='top',
+                                                fontfamily='monospace')
+        
+        # Every artist is returned for blitting each frame: the blit clears each
+        # drawn axes back to its empty background, so omitting one would blank it
+        self._artists = [self._cam_img, *self._rect_pool, *self._label_pool,
+                         self._path_line, self._pos_pt, self._wp_line,
+                         self._anom_scatter, self._status_text]
+        self._last_img_pos = None
+        self._overlays_shown = False
+        
+    @property
+    def anomalies(self) -> List[Anomaly]:
+        """All detected anomalies, materialized from the anomaly log"""
+        return self.anomaly_log.to_anomalies()
         
     def start_inspection(self, waypoints: List[Waypoint]):
         """Start the inspection mission"""
         self.drone.set_flight_path(waypoints)
         self.drone.is_flying = True
         self.inspection_active = True
-        self.anomalies = []
-        
-        # Start the animation
-        self.animation = FuncAnimation(
-            self.fig, self.update_dashboard, interval=100, blit=False
-        )
-        plt.show()
+        self.anomaly_log.clear()
+        self._anom_plotted = 0
+        self._anom_scatter.set_offsets(np.empty((0, 2)))
+        self._last_img_pos = None
+        self._overlays_shown = False
+        
+        # Waypoints and axis limits are fixed for the mission, so set them up once
+        wp_x = [wp.x for wp in waypoints]
+        wp_y = [wp.y for wp in waypoints]
+        self._wp_line.set_data(wp_x, wp_y)
+        
+        xs = wp_x + [self.drone.position[0]]
+        ys = wp_y + [self.drone.position[1]]
+        margin = max(max(xs) - min(xs), max(ys) - min(ys), 10.0) * 0.05
+        for ax in (self.ax_flight, self.ax_anomalies):
+            ax.set_xlim(min(xs) - margin, max(xs) + margin)
+            ax.set_ylim(min(ys) - margin, max(ys) + margin)
+        
+        # Open the anomaly stream, then start the simulation worker and the animation
+        self.anomaly_stream_path = f"inspection_anomalies_{int(time.time())}.ndjson"
+        self._report_fp = open(self.anomaly_stream_path, 'w')
+        self._latest = None
+        # Render one frame here first: numba's parallel thread pool hangs if it is
+        # first launched from a non-main thread
+        self.drone.get_camera_view()
+        self._sim_thread = threading.Thread(target=self._sim_loop, daemon=True)
+        self._sim_thread.start()
+        
+        try:
+            from matplotlib.animation import FuncAnimation  # only needed once a mission runs
+            self.animation = FuncAnimation(
+                self.fig, self.update_dashboard, interval=100, blit=True
+            )
+            plt.show()
+        finally:
+            # Window closed, mission finished or GUI error: stop the worker
+            # and flush the anomaly stream before anything else runs
+            self.inspection_active = False
+            self._sim_thread.join()
+            self._report_fp.close()
+            self._report_fp = None
+        
+    def _sim_loop(self):
+        """Worker loop: advance the drone, grab a frame and run detection"""
+        while self.inspection_active:
+            self.drone.update_position(self.sim_interval)
+            
+            # Get camera view and detect anomalies
+            camera_image = self.drone.get_camera_view()
+            position = tuple(self.drone.position)
+            new_anomalies = self.detector.detect_anomalies(camera_image, position)
+            self.anomaly_log.extend(new_anomalies)
+            if new_anomalies:
+                self._report_fp.write(''.join(
+                    json.dumps(self._anomaly_record(a)) + '\n' for a in new_anomalies
+                ))
+                
+            # Publish the snapshot with a single reference swap
+            self._latest = {'img': camera_image, 'anoms': new_anomalies, 'pos': position}
+            
+            if not self.drone.is_flying:
+                break
+            time.sleep(self.sim_interval)
         
     def update_dashboard(self, frame):
         """Update dashboard displays"""
         if not self.inspection_active:
-            return
+            return self._artists
             
-        # Update drone position
-        self.drone.update_position()
-        
-        # Get camera view and detect anomalies
-        camera_image = self.drone.get_camera_view()
-        new_anomalies = self.detector.detect_anomalies(
-            camera_image, tuple(self.drone.position)
+        # Check before reading so the worker's final snapshot still gets drawn
+        sim_finished = not self._sim_thread.is_alive()
+        latest = self._latest
+        if latest is None:
+            return self._artists
+        camera_image, new_anomalies, position = latest['img'], latest['anoms'], latest['pos']
+        
+        # Update flight path and current position
+        path = self.drone.flight_path
+        self._path_line.set_data(path[:, 0], path[:, 1])
+        self._pos_pt.set_data([position[0]], [position[1]])
+        
+        # Update camera feed with anomaly overlays, skipping the upload when the
+        # scene is effectively unchanged (no detections, overlays already hidden,
+        # drone moved less than 2 m since the last upload)
+        camera_dirty = (
+            bool(new_anomalies) or self._overlays_shown or self._last_img_pos is None
+            or math.dist(position, self._last_img_pos) > 2.0
         )
-        self.anomalies.extend(new_anomalies)
-        
-        # Clear axes
-        self.ax_flight.clear()
-        self.ax_camera.clear()
-        self.ax_anomalies.clear()
-        self.ax_status.clear()
-        
-        # Update flight path
-        self.ax_flight.set_title('Flight Path & Position')
-        self.ax_flight.set_xlabel('X (meters)')
-        self.ax_flight.set_ylabel('Y (meters)')
-        self.ax_flight.grid(True)
-        
-        if self.drone.flight_path:
-            path = np.array(self.drone.flight_path)
-            self.ax_flight.plot(path[:, 0], path[:, 1], 'b-', alpha=0.6, label='Flight Path')
-            
-        # Current position
-        self.ax_flight.plot(self.drone.position[0], self.drone.position[1], 
-                           'ro', markersize=10, label='Current Position')
-        
-        # Waypoints
-        if self.drone.waypoints:
-            wp_x = [wp.x for wp in self.drone.waypoints]
-            wp_y = [wp.y for wp in self.drone.waypoints]
-            self.ax_flight.plot(wp_x, wp_y, 'gs', markersize=8, label='Waypoints')
+        if camera_dirty:
+            self._cam_img.set_data(camera_image)
+            self._last_img_pos = position
+            self._overlays_shown = bool(new_anomalies)
             
-        self.ax_flight.legend()
-        
-        # Update camera feed with anomaly overlays - FIXED VERSION
-        self.ax_camera.set_title('Live Camera Feed')
-        self.ax_camera.axis('off')
-        
-        # Display the RGB image directly (no conversion needed now)
-        self.ax_camera.imshow(camera_image, aspect='auto')
-        
-        # Draw bounding boxes for new anomalies
-        for anomaly in new_anomalies:
-            x, y, w, h = anomaly.bbox
-            color = {'low': 'yellow', 'medium': 'orange', 'high': 'red', 'critical': 'darkred'}
-            rect = patches.Rectangle((x, y), w, h, linewidth=3, 
-                                   edgecolor=color.get(anomaly.severity, 'red'), 
-                                   facecolor='none', alpha=0.8)
-            self.ax_camera.add_patch(rect)
+            # Show bounding boxes for new anomalies, hide the rest of the pool
+            for i, (rect, label) in enumerate(zip(self._rect_pool, self._label_pool)):
+                if i >= len(new_anomalies):
+                    rect.set_visible(False)
+                    label.set_visible(False)
+                    continue
+                
+                anomaly = new_anomalies[i]
+                x, y, w, h = anomaly.bbox
+                rgba = SEVERITY_RGBA.get(anomaly.severity, SEVERITY_RGBA['high'])
+                rect.set_bounds(x, y, w, h)
+                rect.set_edgecolor(rgba)
+                rect.set_visible(True)
             
-            # Add label with background
-            label_text = f"{anomaly.type.upper()} ({anomaly.confidence:.2f})"
-            self.ax_camera.text(x, y-5, label_text, 
-                               color='white', fontsize=9, fontweight='bold',
-                               bbox=dict(boxstyle="round,pad=0.3", 
-                                       facecolor=color.get(anomaly.severity, 'red'), 
-                                       alpha=0.8))
-        
-        # Update anomaly map
-        self.ax_anomalies.set_title('Detected Anomalies')
-        self.ax_anomalies.set_xlabel('X (meters)')
-        self.ax_anomalies.set_ylabel('Y (meters)')
-        self.ax_anomalies.grid(True)
-        
-        if self.anomalies:
-            for anomaly in self.anomalies:
-                color = {'low': 'yellow', 'medium': 'orange', 'high': 'red', 'critical': 'darkred'}
-                self.ax_anomalies.plot(anomaly.position[0], anomaly.position[1], 
-                                     'o', color=color.get(anomaly.severity, 'red'), 
-                                     markersize=8)
+                label.set_position((x, y-5))
+                label.set_text(f"{anomaly.type.upper()} ({anomaly.confidence:.2f})")
+                label.get_bbox_patch().set_facecolor(rgba)
+                label.set_visible(True)
+        
+        # Update anomaly map with everything detected since the last render
+        # (read the count before the columns, which may be swapped when they grow)
+        log = self.anomaly_log
+        n = log.count
+        if n != self._anom_plotted:
+            self._anom_scatter.set_offsets(log.position[:n, :2])
+            self._anom_scatter.set_facecolors(_SEVERITY_RGBA_TABLE[log.severity[:n]])
+            self._anom_plotted = n
         
         # Update status panel
-        self.ax_status.set_title('System Status')
-        self.ax_status.axis('off')
-        
+        type_counts = self.anomaly_log.count_by_type()
+        severity_counts = self.anomaly_log.count_by_severity()
         status_text = f"""
         Flight Status: {'Active' if self.drone.is_flying else 'Landed'}
         Battery Level: {self.drone.battery_level:.1f}%
-        Current Position: ({self.drone.position[0]:.1f}, {self.drone.position[1]:.1f}, {self.drone.position[2]:.1f})
+        Current Position: ({position[0]:.1f}, {position[1]:.1f}, {position[2]:.1f})
         Waypoint: {self.drone.current_waypoint_idx + 1}/{len(self.drone.waypoints)}
         
-        Anomalies Detected: {len(self.anomalies)}
-        • Cracks: {len([a for a in self.anomalies if a.type == 'crack'])}
-        • Rust: {len([a for a in self.anomalies if a.type == 'rust'])}
-        • Loose Bolts: {len([a for a in self.anomalies if a.type == 'loose_bolt'])}
-        • Corrosion: {len([a for a in self.anomalies if a.type == 'corrosion'])}
+        Anomalies Detected: {n}
+        • Cracks: {type_counts['crack']}
+        • Rust: {type_counts['rust']}
+        • Loose Bolts: {type_counts['loose_bolt']}
+        • Corrosion: {type_counts['corrosion']}
         
-        Critical Issues: {len([a for a in self.anomalies if a.severity == 'critical'])}
+        Critical Issues: {severity_counts['critical']}
         """
-        
-        self.ax_status.text(0.1, 0.9, status_text, transform=self.ax_status.transAxes, 
-                           fontsize=10, verticalalignment='top', fontfamily='monospace')
+        self._status_text.set_text(status_text)
         
         # Stop inspection if drone finished
-        if not self.drone.is_flying:
+        if sim_finished:
             self.inspection_active = False
             
+        return self._artists
+            
+    @staticmethod
+    def _anomaly_record(anomaly: Anomaly) -> Dict:
+        """JSON-serializable record of a single anomaly"""
+        return {
+            'id': anomaly.id,
+            'type': anomaly.type,
+            'confidence': anomaly.confidence,
+            'position': anomaly.position,
+            'timestamp': datetime.fromtimestamp(anomaly.timestamp).isoformat(),
+            'severity': anomaly.severity
+        }
+        
     def generate_report(self) -> Dict:
-        """Generate inspection report"""
+        """Generate inspection report summary (details are in the NDJSON stream)"""
         report = {
             'inspection_date': datetime.now().isoformat(),
-            'total_anomalies': len(self.anomalies),
+            'total_anomalies': self.anomaly_log.count,
             'flight_path_length': len(self.drone.flight_path),
             'battery_used': 100 - self.drone.battery_level,
-            'anomalies_by_type': {},
-            'anomalies_by_severity': {},
-            'detailed_anomalies': []
+            'anomalies_by_type': {t: c for t, c in self.anomaly_log.count_by_type().items() if c},
+            'anomalies_by_severity': {s: c for s, c in self.anomaly_log.count_by_severity().items() if c},
+            'detailed_anomalies_file': self.anomaly_stream_path
         }
         
-        # Count by type and severity
-        for anomaly in self.anomalies:
-            report['anomalies_by_type'][anomaly.type] = report['anomalies_by_type'].get(anomaly.type, 0) + 1
-            report['anomalies_by_severity'][anomaly.severity] = report['anomalies_by_severity'].get(anomaly.severity, 0) + 1
-            
-            report['detailed_anomalies'].append({
-                'id': anomaly.id,
-                'type': anomaly.type,
-                'confidence': anomaly.confidence,
-                'position': anomaly.position,
-                'timestamp': anomaly.timestamp.isoformat(),
-                'severity': anomaly.severity
-            })
-            
         return report
 
 # Example usage and demo
@@ -453,7 +669,8 @@ def run_bridge_inspection_demo():
     # Save report to file
     with open(f"inspection_report_{int(time.time())}.json", 'w') as f:
         json.dump(report, f, indent=2, default=str)
-    print(f"\nDetailed report saved to: inspection_report_{int(time.time())}.json")
+    print(f"\nReport saved to: inspection_report_{int(time.time())}.json")
+    print(f"Detailed anomalies saved to: {report['detailed_anomalies_file']}")
 
 if __name__ == "__main__":
     run_bridge_inspection_demo()
\ No newline at end of file